@@ -0,0 +1,26 @@
+"""add datasets.column_types
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables created by AUTO_CREATE_TABLES after this revision already have it
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("datasets")}
+    if "column_types" not in columns:
+        op.add_column("datasets", sa.Column("column_types", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("datasets", "column_types")
@@ -0,0 +1,204 @@
+import math
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+
+# Column types recorded on Dataset.column_types. The row_data JSON keeps
+# JSON-native values (numbers, booleans, ISO 8601 strings for datetimes) so
+# filtering and the frontend keep working unchanged.
+INTEGER = "integer"
+FLOAT = "float"
+BOOLEAN = "boolean"
+DATETIME = "datetime"
+CATEGORY = "category"
+STRING = "string"
+
+# A string column is treated as categorical when at most this fraction of its
+# non-null values are distinct.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Number of leading values checked before parsing a whole string column as
+# numbers; free-text columns are rejected without a full parse.
+INFERENCE_SAMPLE_SIZE = 100
+
+# Largest integer a float64 (and therefore a JSON consumer) holds exactly.
+MAX_SAFE_INTEGER = 2 ** 53
+
+_BOOLEAN_STRINGS = {"true": True, "false": False}
+
+
+def _downcast_numeric(series: "pd.Series") -> Tuple["pd.Series", str]:
+    import pandas as pd
+
+    non_null = series.dropna()
+    if (
+        series.dtype.kind == "f"
+        and (non_null % 1 == 0).all()
+        and (non_null.abs() <= MAX_SAFE_INTEGER).all()
+    ):
+        # Integral floats (usually ints with missing values) become nullable
+        # ints; larger magnitudes stay floats rather than failing the cast
+        series = series.astype("Int64")
+    if series.dtype.kind in "iu" or str(series.dtype).startswith(("Int", "UInt")):
+        return pd.to_numeric(series, downcast="integer"), INTEGER  # type: ignore[reportUnknownMemberType]
+
+    # Only narrow to float32 when every value survives the round trip
+    narrowed = series.astype("float32")
+    if (narrowed.astype("float64") == series)[series.notna()].all():
+        return narrowed, FLOAT
+    return series, FLOAT
+
+
+def _date_format(value: str) -> Optional[str]:
+    """Return the strptime format of a full date such as ``value``, else None.
+
+    Only formats with year, month and day fields qualify, so version strings
+    ("1.2.3") and times of day ("10:30") are not turned into dates.
+    """
+    try:
+        from pandas.tseries.api import guess_datetime_format  # type: ignore[attr-defined]
+    except ImportError:
+        # pandas < 2.2
+        from pandas._libs.tslibs.parsing import guess_datetime_format
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        date_format = guess_datetime_format(value)
+    if date_format is None:
+        return None
+    has_year = "%Y" in date_format or "%y" in date_format
+    has_month = any(field in date_format for field in ("%m", "%b", "%B"))
+    if not (has_year and has_month and "%d" in date_format):
+        return None
+    return date_format
+
+
+def _coerce_column(series: "pd.Series") -> Tuple["pd.Series", str]:
+    import pandas as pd
+
+    if series.dtype.kind == "b" or str(series.dtype) == "boolean":
+        return series, BOOLEAN
+    if series.dtype.kind in "iuf":
+        return _downcast_numeric(series)
+    if series.dtype.kind == "M":
+        return series, DATETIME
+
+    non_null = series.dropna()
+    if non_null.empty:
+        return series, STRING
+    text = non_null.astype(str).str.strip()
+    sample = text.head(INFERENCE_SAMPLE_SIZE)
+
+    if pd.to_numeric(sample, errors="coerce").notna().all():  # type: ignore[reportUnknownMemberType]
+        numbers = pd.to_numeric(text, errors="coerce")  # type: ignore[reportUnknownMemberType]
+        # Long digit strings such as 20-digit IDs would lose precision as
+        # numbers, so they stay strings
+        if numbers.notna().all() and (numbers.abs() <= MAX_SAFE_INTEGER).all():
+            return _downcast_numeric(numbers.reindex(series.index))
+
+    lowered = text.str.lower()
+    if lowered.isin(list(_BOOLEAN_STRINGS)).all():
+        return lowered.map(_BOOLEAN_STRINGS).reindex(series.index).astype("boolean"), BOOLEAN
+
+    # Dates must all share one explicit format; there is no per-value
+    # dateutil fallback that would guess at anything vaguely date-like.
+    date_format = _date_format(text.iloc[0])
+    if date_format is not None:
+        dates = pd.to_datetime(text, format=date_format, errors="coerce")  # type: ignore[reportUnknownMemberType]
+        if dates.notna().all() and getattr(dates.dt, "tz", None) is None:
+            return dates.reindex(series.index), DATETIME
+
+    if non_null.nunique() <= CATEGORY_MAX_UNIQUE_RATIO * len(non_null):
+        return series.astype("category"), CATEGORY
+    return series, STRING
+
+
+def coerce_dataframe(df: "pd.DataFrame") -> Tuple["pd.DataFrame", Dict[str, str]]:
+    """Infer a type for each column and convert it to the most compact dtype.
+
+    Ints and floats are downcast, numbers and booleans read as strings are
+    parsed, date strings become datetimes and repeated strings categoricals.
+    Returns the converted frame and a ``{column: type}`` mapping.
+    """
+    import pandas as pd
+
+    columns: Dict[str, "pd.Series"] = {}
+    column_types: Dict[str, str] = {}
+    for column in df.columns:
+        name = str(column)
+        columns[name], column_types[name] = _coerce_column(df[column])
+    return pd.DataFrame(columns, index=df.index), column_types
+
+
+def _json_values(series: "pd.Series", column_type: str) -> List[Any]:
+    import pandas as pd
+
+    if column_type == DATETIME:
+        non_null = series.dropna()
+        if (non_null == non_null.dt.normalize()).all():
+            series = series.dt.strftime("%Y-%m-%d")
+        elif (non_null.dt.microsecond == 0).all():
+            series = series.dt.strftime("%Y-%m-%dT%H:%M:%S")
+        else:
+            series = series.dt.strftime("%Y-%m-%dT%H:%M:%S.%f")
+    # tolist() yields native Python scalars (int, float, bool, str)
+    values = [None if pd.isna(value) else value for value in series.tolist()]
+    if column_type in (STRING, CATEGORY):
+        # Object columns may hold cells such as Excel datetime.time values
+        return [
+            value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+            for value in values
+        ]
+    return values
+
+
+def to_records(df: "pd.DataFrame", column_types: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Convert a coerced frame into JSON-native row dicts for DataRow.row_data."""
+    names = [str(column) for column in df.columns]
+    values = [_json_values(df[column], column_types[name]) for column, name in zip(df.columns, names)]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        number = float(str(value).strip())
+    except ValueError:
+        return None
+    # float() accepts "nan" and "inf"; those are text here
+    return number if math.isfinite(number) else None
+
+
+def sort_key(column: str, column_type: Any) -> Callable[[Any], Tuple[Any, ...]]:
+    """Return a DataRow sort key that compares values by their column type.
+
+    Missing values sort first. Datetimes are stored as ISO 8601 strings, which
+    already order chronologically. In string and category columns, values
+    that parse as numbers sort numerically ahead of the remaining text, so a
+    column of "10", "9" and "n/a" orders 9, 10, n/a. Datasets uploaded before
+    column types were recorded fall back to case-insensitive string ordering.
+    """
+    def key(row: Any) -> Tuple[Any, ...]:
+        value = row.row_data.get(column)
+        if value is None:
+            return (0,)
+        if column_type in (INTEGER, FLOAT, BOOLEAN):
+            if isinstance(value, (int, float)):
+                return (1, value)
+            # Not expected for typed columns; keep it comparable regardless
+            return (2, str(value).lower())
+        if column_type == DATETIME:
+            return (1, str(value))
+        if column_type in (STRING, CATEGORY):
+            number = _as_number(value)
+            if number is not None:
+                return (1, number)
+            return (2, str(value).lower())
+        return (1, str(value).lower())
+
+    return key
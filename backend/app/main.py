@@ -1,38 +1,39 @@
 from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import List, Optional, Any, Dict, cast, TYPE_CHECKING
+from typing import List, Optional, Any, Dict, AsyncIterator, cast, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import io
 import os
 from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from . import models, schemas
-from .database import get_db, engine
+from . import ingest, models, schemas, startup
+from .database import get_db
 
 if TYPE_CHECKING:
     # Provide pandas types to the type checker without importing at runtime.
     # This helps Pylance understand pandas symbols while we still lazily import
     # pandas at runtime where required.
     import pandas as pd  # type: ignore
+    from passlib.context import CryptContext
 
-# Create tables (safe: catch DB connection errors so the app can still start
-# when a remote DB is not available during local development)
-try:
-    models.Base.metadata.create_all(bind=engine)
-except Exception as e:
-    # Don't raise here — log for visibility and allow the app to start. A
-    # missing / unreachable DB (for example when DATABASE_URL points to a
-    # remote Postgres that isn't running) should not prevent the server from
-    # starting during development.
-    print(f"Warning: could not create DB tables at startup: {e}")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Nothing touches the database or the numeric stack at import time; the
+    # schema is migrated out of band (alembic upgrade head) and the optional
+    # create_all fallback and import warm-up run here instead.
+    startup.bootstrap_database()
+    startup.start_warmup()
+    startup.state.mark_started()
+    yield
 
-app = FastAPI(title="Data Visualization Dashboard", version="1.0.0")
+app = FastAPI(title="Data Visualization Dashboard", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -48,17 +49,24 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
+@lru_cache(maxsize=1)
+def get_pwd_context() -> "CryptContext":
+    # passlib builds its bcrypt backend on first use; defer it past startup
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 def verify_password(plain_password: str, hashed_password: Any) -> bool:
     # hashed_password may be reported as a Column by static checkers; cast at runtime
-    return pwd_context.verify(plain_password, str(hashed_password))
+    return get_pwd_context().verify(plain_password, str(hashed_password))
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
+
     to_encode = data.copy()
     if expires_delta is not None:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -69,6 +77,8 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
     return encoded_jwt
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    from jose import JWTError, jwt
+
     token = credentials.credentials
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -175,6 +185,10 @@ async def upload_dataset(
         else:
             df: Any = pd.read_excel(io.BytesIO(contents))  # type: ignore[reportUnknownMemberType]
         
+        # Infer column types and convert to compact dtypes before storing, so
+        # numbers read as strings are stored as numbers and sort correctly
+        df, column_types = ingest.coerce_dataframe(df)
+
         # Create dataset record
         dataset = models.Dataset(
             name=name,
@@ -182,29 +196,18 @@ async def upload_dataset(
             file_name=filename,
             file_size=len(contents),
             file_type=content_type,
+            column_types=column_types,
             user_id=current_user.id
         )
         db.add(dataset)
         db.commit()
         db.refresh(dataset)
         
-        # Save data rows
-        for _, row in df.iterrows():
-            # Convert numpy types to Python native types
-            row_data = {}
-            for key, value in row.items():
-                if pd.isna(value):
-                    row_data[key] = None
-                elif hasattr(value, 'item'):  # Convert numpy types
-                    row_data[key] = value.item()
-                else:
-                    row_data[key] = value
-            
-            data_row = models.DataRow(
-                dataset_id=dataset.id,
-                row_data=row_data
-            )
-            db.add(data_row)
+        # Save data rows (values are already JSON-native Python types)
+        db.add_all([
+            models.DataRow(dataset_id=dataset.id, row_data=row_data)
+            for row_data in ingest.to_records(df, column_types)
+        ])
         
         db.commit()
         db.refresh(dataset)
@@ -288,12 +291,8 @@ def filter_data(
     
     # Apply sorting
     if filter_request.sort_by:
-        def sort_key(row: models.DataRow) -> str:
-            value = row.row_data.get(filter_request.sort_by)
-            if value is None:
-                return ''
-            return str(value).lower()
-        
+        column_types = cast(Dict[str, str], dataset.column_types or {})
+        sort_key = ingest.sort_key(filter_request.sort_by, column_types.get(filter_request.sort_by))
         reverse = filter_request.sort_order == "desc"
         filtered_rows = sorted(filtered_rows, key=sort_key, reverse=reverse)
     
@@ -455,6 +454,28 @@ def read_root() -> Dict[str, str]:
 def health_check() -> schemas.HealthCheck:
     return schemas.HealthCheck(status="healthy", timestamp=datetime.now(timezone.utc))
 
+@app.get("/ready", response_model=schemas.ReadinessCheck)
+def readiness_check() -> JSONResponse:
+    # Unlike /health (liveness), report whether this replica should receive
+    # traffic: the database answers, its schema is at the latest migration
+    # and the import warm-up has finished.
+    db_error = startup.check_database()
+    warmed_up = startup.state.warmup_done.is_set()
+    ready = db_error is None and warmed_up
+    body = schemas.ReadinessCheck(
+        status="ready" if ready else "starting",
+        timestamp=datetime.now(timezone.utc),
+        database=db_error is None,
+        warmed_up=warmed_up,
+        startup_seconds=startup.state.startup_seconds,
+        warmup_seconds=startup.state.warmup_seconds,
+        detail=db_error or startup.state.warmup_error,
+    )
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=body.model_dump(mode="json"),
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
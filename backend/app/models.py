@@ -27,6 +27,7 @@ class Dataset(Base):
     file_name = Column(String(255), nullable=False)
     file_size = Column(Integer)
     file_type = Column(String(50))
+    column_types = Column(JSON)  # {column: type} inferred at upload, see ingest.py
     user_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
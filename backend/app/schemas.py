@@ -47,6 +47,7 @@ class DatasetResponse(DatasetBase):
     created_at: datetime
     updated_at: datetime
     row_count: Optional[int] = 0
+    column_types: Optional[Dict[str, str]] = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -134,6 +135,15 @@ class HealthCheck(BaseModel):
     timestamp: datetime
     version: str = "1.0.0"
 
+class ReadinessCheck(BaseModel):
+    status: str
+    timestamp: datetime
+    database: bool
+    warmed_up: bool
+    startup_seconds: Optional[float] = None
+    warmup_seconds: Optional[float] = None
+    detail: Optional[str] = None
+
 # Additional schemas for advanced features
 class ColumnAnalysis(BaseModel):
     column_name: str
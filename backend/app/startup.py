@@ -0,0 +1,125 @@
+import importlib
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Tuple, TYPE_CHECKING
+
+from sqlalchemy import inspect, text
+
+from . import models
+from .database import engine
+
+if TYPE_CHECKING:
+    from alembic.script import ScriptDirectory
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic")
+
+# Modules the request handlers import lazily (the numeric stack for uploads
+# and charts, jose/passlib for auth). Importing them in a background thread
+# after startup keeps the first request from paying for it.
+WARMUP_MODULES: Tuple[str, ...] = (
+    "numpy",
+    "pandas",
+    "openpyxl",
+    "jose.jwt",
+    "passlib.context",
+)
+
+
+def env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class StartupState:
+    """Tracks the lifecycle of the API process for the readiness endpoint."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.startup_seconds: Optional[float] = None
+        self.warmup_enabled = False
+        self.warmup_done = threading.Event()
+        self.warmup_seconds: Optional[float] = None
+        self.warmup_error: Optional[str] = None
+
+    def mark_started(self) -> None:
+        self.startup_seconds = time.perf_counter() - self.started_at
+
+
+state = StartupState()
+
+
+def bootstrap_database() -> None:
+    """Create missing tables when AUTO_CREATE_TABLES is enabled.
+
+    Schema changes are normally applied out of band with ``alembic upgrade
+    head``; the create_all fallback only exists for local SQLite development.
+    """
+    if not env_flag("AUTO_CREATE_TABLES", True):
+        return
+    try:
+        with engine.begin() as connection:
+            is_empty = not inspect(connection).get_table_names()
+            models.Base.metadata.create_all(bind=connection)
+            if is_empty:
+                # The schema was built from the current models, so it is at
+                # head; record that so /ready and alembic agree.
+                from alembic.migration import MigrationContext
+
+                MigrationContext.configure(connection).stamp(_migrations(), "head")
+    except Exception as e:
+        # A missing / unreachable DB should not prevent the server from
+        # starting during development; /ready reports it instead.
+        print(f"Warning: could not create DB tables at startup: {e}")
+
+
+def _warm_up() -> None:
+    start = time.perf_counter()
+    try:
+        for module_name in WARMUP_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                # Optional at runtime; the handlers report a clear error.
+                continue
+    except Exception as e:
+        state.warmup_error = str(e)
+    finally:
+        state.warmup_seconds = time.perf_counter() - start
+        state.warmup_done.set()
+
+
+def start_warmup() -> None:
+    """Import the numeric stack in a daemon thread when WARMUP_IMPORTS is on."""
+    state.warmup_enabled = env_flag("WARMUP_IMPORTS", True)
+    if not state.warmup_enabled:
+        state.warmup_done.set()
+        return
+    threading.Thread(target=_warm_up, name="import-warmup", daemon=True).start()
+
+
+@lru_cache(maxsize=1)
+def _migrations() -> "ScriptDirectory":
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory(MIGRATIONS_DIR)
+
+
+def check_database() -> Optional[str]:
+    """Return None if the database answers and its schema is at the latest
+    migration, else a description of the problem."""
+    try:
+        from alembic.migration import MigrationContext
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            current = MigrationContext.configure(connection).get_current_revision()
+        head = _migrations().get_current_head()
+    except Exception as e:
+        return str(e)
+    if current != head:
+        return f"database schema is at revision {current}, expected {head}: run alembic upgrade head"
+    return None
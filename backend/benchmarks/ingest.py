@@ -0,0 +1,97 @@
+"""Measure memory and storage of uploaded data before and after type coercion.
+
+Run from the backend directory:
+
+    python -m benchmarks.ingest [path/to/file.csv] [--rows 100000]
+
+Without a path a synthetic CSV with numeric, date, repeated-string and
+free-text columns is generated. Reports the DataFrame footprint
+(``memory_usage(deep=True)``), the serialized row_data JSON size and the
+conversion time for the previous row-by-row path and for ``app.ingest``.
+"""
+import argparse
+import io
+import json
+import random
+import time
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from app import ingest
+
+
+def synthetic_csv(rows: int) -> bytes:
+    rng = random.Random(0)
+    cities = ["New York", "San Francisco", "Chicago", "Austin", "Seattle"]
+    lines = ["id,age,salary,score,joined,city,name"]
+    for i in range(rows):
+        lines.append(
+            f"{i},{rng.randint(18, 70)},{rng.randint(30000, 150000)},"
+            f"{rng.randint(0, 100) / 4},2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d},"
+            f"{rng.choice(cities)},user{i}"
+        )
+    return "\n".join(lines).encode()
+
+
+def legacy_records(df: Any) -> List[Dict[str, Any]]:
+    # The iterrows conversion upload_dataset used before app.ingest
+    records: List[Dict[str, Any]] = []
+    for _, row in df.iterrows():
+        row_data: Dict[str, Any] = {}
+        for key, value in row.items():
+            if pd.isna(value):
+                row_data[key] = None
+            elif hasattr(value, "item"):
+                row_data[key] = value.item()
+            else:
+                row_data[key] = value
+        records.append(row_data)
+    return records
+
+
+def json_bytes(records: List[Dict[str, Any]]) -> int:
+    return sum(len(json.dumps(record, default=str)) for record in records)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    if args.path:
+        with open(args.path, "rb") as f:
+            contents = f.read()
+    else:
+        contents = synthetic_csv(args.rows)
+    if args.path and not args.path.endswith(".csv"):
+        df: Any = pd.read_excel(io.BytesIO(contents))
+    else:
+        df = pd.read_csv(io.BytesIO(contents))
+
+    start = time.perf_counter()
+    before_records = legacy_records(df)
+    before_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    coerced, column_types = ingest.coerce_dataframe(df)
+    after_records = ingest.to_records(coerced, column_types)
+    after_seconds = time.perf_counter() - start
+
+    before_memory = int(df.memory_usage(deep=True).sum())
+    after_memory = int(coerced.memory_usage(deep=True).sum())
+    before_json = json_bytes(before_records)
+    after_json = json_bytes(after_records)
+
+    print(f"rows: {len(df)}  columns: {len(df.columns)}")
+    for column, column_type in column_types.items():
+        print(f"  {column:<20} {str(df[column].dtype):<10} -> {str(coerced[column].dtype):<10} ({column_type})")
+    print(f"{'':<20} {'before':>14} {'after':>14}")
+    print(f"{'DataFrame memory':<20} {before_memory:>12,} B {after_memory:>12,} B")
+    print(f"{'row_data JSON':<20} {before_json:>12,} B {after_json:>12,} B")
+    print(f"{'conversion time':<20} {before_seconds * 1000:>11.1f} ms {after_seconds * 1000:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Measure API cold-start cost.
+
+Run from the backend directory:
+
+    python -m benchmarks.startup [--runs 5] [--ready]
+
+Reports the time to import ``app.main`` in a fresh interpreter and, with
+``--ready``, the time from launching uvicorn until ``/ready`` returns 200.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def time_import(runs: int) -> List[float]:
+    code = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+    samples: List[float] = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=BACKEND_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def time_ready(runs: int, port: int, timeout: float) -> List[float]:
+    url = f"http://127.0.0.1:{port}/ready"
+    samples: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+            cwd=BACKEND_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while True:
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"{url} did not become ready within {timeout}s")
+                try:
+                    with urllib.request.urlopen(url, timeout=1) as response:
+                        if response.status == 200:
+                            break
+                except (urllib.error.URLError, ConnectionError):
+                    pass
+                time.sleep(0.02)
+            samples.append(time.perf_counter() - start)
+        finally:
+            proc.terminate()
+            proc.wait()
+    return samples
+
+
+def report(label: str, samples: List[float]) -> None:
+    print(
+        f"{label:<20} median {statistics.median(samples) * 1000:8.1f} ms"
+        f"  min {min(samples) * 1000:8.1f} ms  max {max(samples) * 1000:8.1f} ms"
+        f"  (n={len(samples)})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ready", action="store_true", help="also measure time until /ready")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    report("import app.main", time_import(args.runs))
+    if args.ready:
+        report("launch -> /ready", time_ready(args.runs, args.port, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import datetime
+import io
+
+import pandas as pd
+
+from app import ingest
+
+
+class Row:
+    def __init__(self, row_data):
+        self.row_data = row_data
+
+
+def coerce_csv(csv):
+    df = pd.read_csv(io.StringIO(csv))
+    coerced, column_types = ingest.coerce_dataframe(df)
+    return ingest.to_records(coerced, column_types), column_types
+
+
+def test_version_strings_are_not_dates():
+    records, column_types = coerce_csv("v\n1.2.3\n4.5.6\n")
+    assert column_types == {"v": ingest.STRING}
+    assert [r["v"] for r in records] == ["1.2.3", "4.5.6"]
+
+
+def test_times_of_day_are_not_dates():
+    records, column_types = coerce_csv("t\n10:30\n11:45\n")
+    assert column_types == {"t": ingest.STRING}
+    assert [r["t"] for r in records] == ["10:30", "11:45"]
+
+
+def test_excel_time_cells_stay_strings():
+    df = pd.DataFrame({"t": [datetime.time(10, 30), datetime.time(11, 45)]})
+    coerced, column_types = ingest.coerce_dataframe(df)
+    assert column_types == {"t": ingest.STRING}
+    assert [r["t"] for r in ingest.to_records(coerced, column_types)] == ["10:30:00", "11:45:00"]
+
+
+def test_full_dates_are_parsed():
+    records, column_types = coerce_csv("d,ts\n2024-01-05,2024-01-05 10:30\n2023-12-31,2024-01-06 11:00\n")
+    assert column_types == {"d": ingest.DATETIME, "ts": ingest.DATETIME}
+    assert records[0] == {"d": "2024-01-05", "ts": "2024-01-05T10:30:00"}
+
+
+def test_fractional_seconds_are_kept():
+    records, column_types = coerce_csv("ts\n2024-01-01 10:00:00.123\n2024-01-01 10:00:00.456\n")
+    assert column_types == {"ts": ingest.DATETIME}
+    assert [r["ts"] for r in records] == ["2024-01-01T10:00:00.123000", "2024-01-01T10:00:00.456000"]
+
+
+def test_out_of_range_integral_floats_stay_floats():
+    records, column_types = coerce_csv("a\n1e20\n2e20\n")
+    assert column_types == {"a": ingest.FLOAT}
+    assert [r["a"] for r in records] == [1e20, 2e20]
+
+
+def test_numeric_strings_in_string_column_sort_numerically():
+    records, column_types = coerce_csv("id,n\n1,10\n2,9\n3,abc\n4,\n")
+    assert column_types["n"] == ingest.STRING
+    rows = sorted((Row(r) for r in records), key=ingest.sort_key("n", column_types["n"]))
+    assert [row.row_data["n"] for row in rows] == [None, "9", "10", "abc"]
+
+
+def test_typed_integer_column_sorts_numerically():
+    records, column_types = coerce_csv("n\n10\n9\n100\n")
+    rows = sorted((Row(r) for r in records), key=ingest.sort_key("n", column_types["n"]), reverse=True)
+    assert [row.row_data["n"] for row in rows] == [100, 10, 9]